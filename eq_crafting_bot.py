@@ -1,114 +1,27 @@
-async def _parse_recipe_with_names(self, data):
-        """Parse API response into Recipe object with component name lookups"""
-        try:
-            # Log the raw data structure for debugging
-            logger.debug(f"Parsing recipe data: {json.dumps(data, indent=2)[:300]}...")
-            
-            # Extract basic recipe information
-            name = data.get("name", "Unknown Recipe")
-            trivial_level = data.get("trivial", None)
-            skill_needed = data.get("skillneeded", 0)
-            tradeskill_id = data.get("tradeskill", None)
-            
-            # Map tradeskill ID to name
-            if tradeskill_id is not None:
-                profession = self.TRADESKILL_NAMES.get(tradeskill_id, f"Unknown Skill ({tradeskill_id})")
-                logger.debug(f"Mapped tradeskill ID {tradeskill_id} to {profession}")
-            else:
-                profession = "Unknown"
-            
-            # Parse tradeskill_entries for components and container
-            components = []
-            crafting_station = "Unknown"
-            
-            tradeskill_entries = data.get("tradeskill_entries", [])
-            if isinstance(tradeskill_entries, list):
-                for entry in tradeskill_entries:
-                    if isinstance(entry, dict):
-                        # Check if this is a crafting container
-                        if entry.get("iscontainer", 0) == 1:
-                            container_item_id = entry.get("item_id")
-                            # Look up container name
-                            container_data = await self.get_item_by_id(str(container_item_id))
-                            if container_data and container_data.get("name"):
-                                crafting_station = container_data.get("name")
-                            else:
-                                crafting_station = f"Container ID: {container_item_id}"
-                            logger.debug(f"Found crafting container: {crafting_station}")
-                        
-                        # Check if this is a component (has componentcount > 0)
-                        elif entry.get("componentcount", 0) > 0:
-                            item_id = entry.get("item_id")
-                            quantity = entry.get("componentcount", 1)
-                            
-                            # Look up component name
-                            component_data = await self.get_item_by_id(str(item_id))
-                            if component_data and component_data.get("name"):
-                                component_name = component_data.get("name")
-                            else:
-                                component_name = f"Item ID: {item_id}"
-                            
-                            component = {
-                                "name": component_name,
-                                "quantity": quantity,
-                                "item_id": item_id
-                            }
-                            components.append(component)
-                            logger.debug(f"Found component: {quantity}x {component_name}")
-            
-            # Ensure numeric fields are properly typed
-            try:
-                skill_level = int(skill_needed) if skill_needed is not None else 0
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid skill_needed value: {skill_needed}, defaulting to 0")
-                skill_level = 0
-                
-            try:
-                trivial_level = int(trivial_level) if trivial_level is not None else None
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid trivial_level value: {trivial_level}, setting to None")
-                trivial_level = None
-            
-            recipe = Recipe(
-                name=str(name),
-                skill_level=skill_level,
-                profession=str(profession),
-                crafting_station=str(crafting_station),
-                components=components,
-                success_rate=None,  # Not available in this API response format
-                trivial_level=trivial_level
-            )
-            
-            logger.debug(f"Successfully parsed recipe: {recipe.name} ({recipe.profession})")
-            return recipe
-            
-        except Exception as e:
-            logger.error(f"Error parsing recipe data: {e}")
-            # Return a basic recipe with error information
-            return Recipe(
-                name="Error parsing recipe",
-                skill_level=0,
-                profession="Unknown",
-                crafting_station="Unknown",
-                components=[]
-            )#!/usr/bin/env python3
+#!/usr/bin/env python3
 """
 EverQuest Crafting Request Bot
 A Discord bot that handles crafting item requests and displays recipes from eqdb.net
 """
 
 import os
+import atexit
 import logging
+import logging.handlers
+import queue
 import asyncio
 import aiohttp
 import discord
 from discord.ext import commands
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from datetime import datetime
 import json
 import re
 import signal
+import sqlite3
 import sys
+import time
+from collections import OrderedDict
 
 # Import typing - fix the Dict import issue
 from typing import Optional, Dict, Any, List, Tuple, Union
@@ -120,18 +33,72 @@ try:
 except ImportError:
     logging.warning("python-dotenv not installed. Environment variables must be set manually.")
 
+# Use orjson for faster JSON decoding/encoding when available
+try:
+    import orjson
+
+    def json_loads(raw):
+        """Decode JSON from bytes or str"""
+        return orjson.loads(raw)
+
+    def json_dumps(data) -> bytes:
+        """Encode data as compact JSON bytes"""
+        return orjson.dumps(data)
+
+    def json_dumps_pretty(data) -> str:
+        """Encode data as indented JSON text"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def json_loads(raw):
+        """Decode JSON from bytes or str"""
+        return json.loads(raw)
+
+    def json_dumps(data) -> bytes:
+        """Encode data as compact JSON bytes"""
+        return json.dumps(data, separators=(',', ':')).encode()
+
+    def json_dumps_pretty(data) -> str:
+        """Encode data as indented JSON text"""
+        return json.dumps(data, indent=2)
+
+# Persist looked-up items to SQLite across restarts when aiosqlite is available
+try:
+    import aiosqlite
+except ImportError:
+    aiosqlite = None
+
 # Configure logging
+# Records are queued and written to the file/console by a background thread,
+# so logging calls never block the event loop on disk I/O
+log_queue = queue.SimpleQueue()
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('eq_bot.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(log_queue)]
+)
+log_listener = logging.handlers.QueueListener(
+    log_queue,
+    logging.FileHandler('eq_bot.log'),
+    logging.StreamHandler()
 )
+log_listener.start()
+atexit.register(log_listener.stop)  # Flush queued records on exit
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Forum post title patterns, each paired with its (item group, character group)
+FORUM_TITLE_PATTERNS = [
+    # Pattern 1: "Item Name for Character"
+    (re.compile(r'(.+?)\s+for\s+(\w+)', re.IGNORECASE), (1, 2)),
+    # Pattern 2: "Character needs Item Name"
+    (re.compile(r'(\w+)\s+needs\s+(.+)', re.IGNORECASE), (2, 1)),
+    # Pattern 3: "Request: Item Name - Character" (hyphen, en dash or em dash)
+    (re.compile(r'request:?\s*(.+?)\s*[-\u2013\u2014]\s*(\w+)', re.IGNORECASE), (1, 2)),
+]
+
+# Slotted dataclasses avoid a per-instance __dict__ (slots= requires Python 3.10+)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Recipe:
     """Data class for crafting recipe information"""
     name: str
@@ -142,7 +109,7 @@ class Recipe:
     success_rate: Optional[str] = None
     trivial_level: Optional[int] = None
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CraftingRequest:
     """Data class for user crafting requests"""
     character: str
@@ -150,6 +117,42 @@ class CraftingRequest:
     requester: discord.Member
     timestamp: datetime
 
+class LRUCache:
+    """Size-bounded LRU cache with optional per-entry expiry"""
+    
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Any, Tuple[Any, Optional[float]]]" = OrderedDict()
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def get(self, key) -> Tuple[bool, Any]:
+        """Return (hit, value) for a key, dropping the entry if it has expired"""
+        cached = self._entries.get(key)
+        if cached is None:
+            return False, None
+        
+        value, expires_at = cached
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._entries[key]
+            return False, None
+        
+        self._entries.move_to_end(key)
+        return True, value
+    
+    def set(self, key, value, ttl: Optional[float] = None):
+        """Store a value that expires after ttl seconds (never if ttl is None)"""
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Remove all entries"""
+        self._entries.clear()
+
 class EQDBClient:
     """Client for interacting with eqdb.net API"""
     
@@ -169,69 +172,171 @@ class EQDBClient:
         69: "Pottery"
     }
     
-    def __init__(self, session: aiohttp.ClientSession):
+    # Tradeskill names indexed directly by tradeskill ID (None for unused IDs)
+    TRADESKILL_NAMES_BY_ID = tuple(map(TRADESKILL_NAMES.get, range(max(TRADESKILL_NAMES) + 1)))
+    
+    # Possible JSON field names for each recipe field, in order of preference
+    RECIPE_FIELD_NAMES = {
+        'name': ['name', 'item_name', 'recipe_name'],
+        'skill_level': ['skill', 'skill_level', 'required_skill', 'skilllevel'],
+        'profession': ['tradeskill', 'profession', 'trade_skill'],
+        'crafting_station': ['station', 'container', 'crafting_station'],
+        'components': ['components', 'ingredients', 'items'],
+        'success_rate': ['success_rate', 'successrate'],
+        'trivial_level': ['trivial', 'trivial_level', 'triviallevel'],
+    }
+    
+    # Flattened lookup: JSON field name -> (recipe field, preference)
+    _FIELD_ALIASES = {
+        field_name: (field, priority)
+        for field, field_names in RECIPE_FIELD_NAMES.items()
+        for priority, field_name in enumerate(field_names)
+    }
+    
+    # Default headers for JSON API requests (set once on the shared session)
+    DEFAULT_HEADERS = {
+        'Accept': 'application/json',
+        'User-Agent': 'EverQuest-Crafting-Bot/1.0'
+    }
+    
+    # Item lookup cache limits
+    ITEM_CACHE_MAX_SIZE = 4096        # Maximum number of cached item lookups
+    ITEM_NEGATIVE_CACHE_TTL = 300     # Seconds to remember items the API does not have
+    ITEM_DB_CACHE_TTL = 7 * 24 * 3600 # Seconds before a stored item is re-fetched
+    
+    # Recipe cache limits (recipes rarely change, so cache them for hours)
+    RECIPE_CACHE_MAX_SIZE = 1024
+    RECIPE_CACHE_TTL = 6 * 3600       # Seconds to keep found recipes
+    RECIPE_NEGATIVE_CACHE_TTL = 300   # Seconds to remember missing recipes
+    
+    # Seconds between batched writes to the SQLite cache
+    DB_FLUSH_INTERVAL = 5
+    
+    # Attempts per API request when rate limited (429), with exponential backoff
+    MAX_REQUEST_ATTEMPTS = 3
+    
+    # Concurrent API requests allowed unless EQDB_MAX_CONCURRENCY overrides it
+    DEFAULT_MAX_CONCURRENCY = 8
+    
+    def __init__(self, session: aiohttp.ClientSession, cache_db=None):
         self.session = session
+        self.cache_db = cache_db                  # Optional aiosqlite connection for item/recipe caches
         self.base_url = "https://eqdb.net/api/v1"
         self.items_endpoint = "/items"            # For both name and ID lookups
         self.trades_endpoint = "/trades"          # For getting recipe data by item ID
         
-        # Default headers for JSON API requests
-        self.headers = {
-            'Accept': 'application/json',
-            'Content-Type': 'application/json',
-            'User-Agent': 'EverQuest-Crafting-Bot/1.0'
-        }
+        # Cap concurrent API requests to stay under eqdb.net rate limits
+        self._request_semaphore = asyncio.Semaphore(self._max_concurrency())
+        
+        # LRU caches keyed by item ID; found items never expire
+        self._item_cache = LRUCache(self.ITEM_CACHE_MAX_SIZE)
+        self._recipe_cache = LRUCache(self.RECIPE_CACHE_MAX_SIZE)
+        # In-flight item and recipe lookups, so concurrent callers share a single request
+        self._item_inflight: Dict[str, asyncio.Future] = {}
+        self._recipe_inflight: Dict[str, asyncio.Future] = {}
+        # Pending SQLite cache writes keyed by (table, id), flushed in batches
+        self._pending_db_writes: Dict[Tuple[str, str], Tuple[str, tuple]] = {}
+        self._db_flush_task: Optional[asyncio.Task] = None
+        # Cleared if the items endpoint turns out not to accept ?ids=1,2,3
+        self._batch_lookup_supported = True
+    
+    @classmethod
+    def _max_concurrency(cls) -> int:
+        """Get the API request concurrency limit from EQDB_MAX_CONCURRENCY (at least 1)"""
+        value = os.getenv('EQDB_MAX_CONCURRENCY')
+        if not value:
+            return cls.DEFAULT_MAX_CONCURRENCY
+        try:
+            return max(1, int(value))
+        except ValueError:
+            logger.error(f"Invalid EQDB_MAX_CONCURRENCY: {value}, using {cls.DEFAULT_MAX_CONCURRENCY}")
+            return cls.DEFAULT_MAX_CONCURRENCY
     
     async def _make_json_request(self, url: str, params=None):
         """Make a JSON API request with proper error handling"""
-        try:
-            async with self.session.get(url, params=params, headers=self.headers) as response:
-                # Log the request for debugging
-                logger.debug(f"API Request: {response.url}")
-                
-                if response.status == 200:
-                    # Verify content type is JSON
-                    content_type = response.headers.get('content-type', '')
-                    if 'application/json' not in content_type.lower():
-                        logger.warning(f"Unexpected content-type: {content_type}")
-                    
-                    try:
-                        data = await response.json()
-                        logger.debug(f"API Response: {json.dumps(data, indent=2)[:500]}...")  # Log first 500 chars
-                        return data
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to parse JSON response: {e}")
-                        # Try to get raw text for debugging
-                        raw_text = await response.text()
-                        logger.error(f"Raw response: {raw_text[:200]}...")
-                        return None
+        _, data = await self._request_json(url, params)
+        return data
+    
+    async def _request_json(self, url: str, params=None) -> Tuple[Optional[int], Any]:
+        """Make a JSON API request, returning (HTTP status, parsed data)
+        
+        The status is None when no response was received, and the data is None
+        for any non-200 response or unparseable body.
+        """
+        for attempt in range(1, self.MAX_REQUEST_ATTEMPTS + 1):
+            try:
+                # Limit the number of requests in flight to eqdb.net at once
+                async with self._request_semaphore:
+                    async with self.session.get(url, params=params) as response:
+                        # Log the request for debugging
+                        logger.debug(f"API Request: {response.url}")
                         
-                elif response.status == 404:
-                    logger.info(f"Resource not found (404): {response.url}")
-                    return None
-                    
-                elif response.status == 429:
-                    logger.warning(f"Rate limited (429): {response.url}")
-                    return None
-                    
-                else:
-                    logger.warning(f"API request failed with status {response.status}: {response.url}")
-                    # Try to get error details from response
-                    try:
-                        error_data = await response.json()
-                        logger.warning(f"Error details: {error_data}")
-                    except:
-                        error_text = await response.text()
-                        logger.warning(f"Error response: {error_text[:200]}...")
-                    return None
-                    
-        except aiohttp.ClientError as e:
-            logger.error(f"Network error during API request: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error during API request: {e}")
-            return None
+                        if response.status == 200:
+                            # Verify content type is JSON
+                            content_type = response.headers.get('content-type', '')
+                            if 'application/json' not in content_type.lower():
+                                logger.warning(f"Unexpected content-type: {content_type}")
+                            
+                            # Read the body once and reuse it for parsing and error logging
+                            body = await response.read()
+                            try:
+                                data = json_loads(body)
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug("API Response: %s...", json_dumps_pretty(data)[:500])  # Log first 500 chars
+                                return response.status, data
+                            except ValueError as e:
+                                logger.error(f"Failed to parse JSON response: {e}")
+                                logger.error("Raw response: %s...", body[:200].decode(errors='replace'))
+                                return response.status, None
+                                
+                        elif response.status == 404:
+                            logger.info(f"Resource not found (404): {response.url}")
+                            return response.status, None
+                            
+                        elif response.status == 429:
+                            if attempt == self.MAX_REQUEST_ATTEMPTS:
+                                logger.warning(f"Rate limited (429), giving up: {response.url}")
+                                return response.status, None
+                            logger.warning(f"Rate limited (429), retrying (attempt {attempt}): {response.url}")
+                            
+                        else:
+                            logger.warning(f"API request failed with status {response.status}: {response.url}")
+                            # Try to get error details from response
+                            body = await response.read()
+                            try:
+                                error_data = json_loads(body)
+                                logger.warning(f"Error details: {error_data}")
+                            except ValueError:
+                                logger.warning("Error response: %s...", body[:200].decode(errors='replace'))
+                            return response.status, None
+                            
+            except aiohttp.ClientError as e:
+                logger.error(f"Network error during API request: {e}")
+                return None, None
+            except Exception as e:
+                logger.error(f"Unexpected error during API request: {e}")
+                return None, None
+            
+            # Back off exponentially before retrying a rate-limited request
+            await asyncio.sleep(2 ** attempt)
+        
+        return None, None
         
+    @staticmethod
+    def _unwrap_items(data) -> Optional[List[Any]]:
+        """Get the list of items from an items endpoint response
+        
+        Handles a bare list, an {"items": [...]} wrapper, or a single item
+        object. Returns None for any other response format.
+        """
+        if isinstance(data, list):
+            return data
+        if isinstance(data, dict):
+            items = data.get('items')
+            # Check if it's a wrapper object or a single item result
+            return items if isinstance(items, list) else [data]
+        return None
+    
     async def search_item(self, item_name: str):
         """Search for an item by name to get its ID"""
         try:
@@ -244,126 +349,578 @@ class EQDBClient:
             if data is None:
                 return None
                 
-            # Handle different response formats
-            if isinstance(data, list):
-                if len(data) > 0:
-                    logger.info(f"Found {len(data)} items matching '{item_name}', using first result")
-                    return data[0]  # Return first matching item
-                else:
-                    logger.info(f"No items found for search: '{item_name}'")
-                    return None
-            elif isinstance(data, dict):
-                # Check if it's a single item result or a wrapper object
-                if 'items' in data and isinstance(data['items'], list):
-                    items = data['items']
-                    if len(items) > 0:
-                        logger.info(f"Found {len(items)} items matching '{item_name}', using first result")
-                        return items[0]
-                    else:
-                        logger.info(f"No items found for search: '{item_name}'")
-                        return None
-                else:
-                    return data  # Assume it's a single item result
-            else:
+            items = self._unwrap_items(data)
+            if items is None:
                 logger.warning(f"Unexpected response format for item search: {type(data)}")
                 return None
+            if not items:
+                logger.info(f"No items found for search: '{item_name}'")
+                return None
+            
+            logger.info(f"Found {len(items)} items matching '{item_name}', using first result")
+            return items[0]  # Return first matching item
                 
         except Exception as e:
             logger.error(f"Error searching for item '{item_name}': {e}")
             return None
     
+    def _cache_item(self, item_id: str, item_data: Optional[Dict[str, Any]]):
+        """Store an item lookup result in the in-memory cache"""
+        ttl = None if item_data is not None else self.ITEM_NEGATIVE_CACHE_TTL
+        self._item_cache.set(item_id, item_data, ttl)
+    
     async def get_item_by_id(self, item_id: str):
-        """Get item details by ID"""
+        """Get item details by ID, using the in-memory cache when possible"""
+        hit, item_data = self._item_cache.get(item_id)
+        if hit:
+            return item_data
+        
+        return await self._single_flight(self._item_inflight, item_id, self._load_item)
+    
+    async def _single_flight(self, inflight: Dict[str, asyncio.Future], key: str, load):
+        """Run load(key) at most once at a time per key
+        
+        Concurrent callers for a key that is already being loaded await the
+        same future instead of issuing a duplicate request.
+        """
+        future = inflight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+        
+        future = asyncio.get_running_loop().create_future()
+        inflight[key] = future
+        try:
+            result = await load(key)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            # Hand the error to any waiters; mark it retrieved in case there are none
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            if not future.done():
+                future.cancel()  # Release waiters if this load was cancelled
+            inflight.pop(key, None)
+    
+    async def _load_item(self, item_id: str):
+        """Load item details from SQLite or the API and cache them in memory"""
+        item_data = await self._load_stored_item(item_id)
+        if item_data is not None:
+            self._cache_item(item_id, item_data)
+            return item_data
+        
+        return await self._fetch_and_cache_item(item_id)
+    
+    async def _fetch_and_cache_item(self, item_id: str):
+        """Fetch item details from the API and cache them in memory and SQLite"""
+        # Failed lookups are not cached, so they are retried on the next request
+        item_data, definitive = await self._fetch_item_by_id(item_id)
+        if item_data is not None:
+            self._store_item(item_id, item_data)
+        if definitive:
+            self._cache_item(item_id, item_data)
+        return item_data
+    
+    async def get_items_by_ids(self, item_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get details for several items at once, keyed by item ID
+        
+        Cached items are served directly. The rest are requested in a single
+        batched call, falling back to concurrent per-item lookups for any IDs
+        the batch did not return.
+        """
+        items = {}
+        pending = []
+        for item_id in dict.fromkeys(item_ids):
+            hit, item_data = self._item_cache.get(item_id)
+            if not hit:
+                item_data = await self._load_stored_item(item_id)
+                if item_data is None:
+                    pending.append(item_id)
+                    continue
+                self._cache_item(item_id, item_data)
+            if item_data is not None:
+                items[item_id] = item_data
+        
+        # IDs already being looked up elsewhere are awaited below instead of re-requested
+        batch_ids = [item_id for item_id in pending if item_id not in self._item_inflight]
+        if len(batch_ids) > 1 and self._batch_lookup_supported:
+            items.update(await self._load_items_batch(batch_ids))
+            batched = set(batch_ids)
+            pending = [item_id for item_id in pending if item_id not in batched]
+        
+        if pending:
+            results = await asyncio.gather(
+                *(self.get_item_by_id(item_id) for item_id in pending),
+                return_exceptions=True
+            )
+            for item_id, result in zip(pending, results):
+                if isinstance(result, dict):
+                    items[item_id] = result
+        
+        return items
+    
+    async def _load_items_batch(self, item_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Load several items with one batched request, keyed by item ID
+        
+        The IDs are registered as in-flight lookups, so concurrent callers for
+        any of them await this batch instead of issuing their own request. IDs
+        the batch did not return fall back to per-item lookups.
+        """
+        loop = asyncio.get_running_loop()
+        futures = {item_id: loop.create_future() for item_id in item_ids}
+        self._item_inflight.update(futures)
+        try:
+            found = await self._fetch_items_batch(item_ids)
+            for item_id, item_data in found.items():
+                self._store_item(item_id, item_data)
+                self._cache_item(item_id, item_data)
+                futures[item_id].set_result(item_data)
+            
+            missing = [item_id for item_id in item_ids if item_id not in found]
+            results = await asyncio.gather(*(self._fetch_and_cache_item(item_id) for item_id in missing))
+            for item_id, item_data in zip(missing, results):
+                futures[item_id].set_result(item_data)
+                if item_data is not None:
+                    found[item_id] = item_data
+            return found
+        except Exception as e:
+            # Hand the error to any waiters; mark it retrieved in case there are none
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+                    future.exception()
+            raise
+        finally:
+            for item_id, future in futures.items():
+                if not future.done():
+                    future.cancel()  # Release waiters if this load was cancelled
+                if self._item_inflight.get(item_id) is future:
+                    del self._item_inflight[item_id]
+    
+    async def _fetch_items_batch(self, item_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch several items from the API in one request, keyed by item ID"""
+        url = f"{self.base_url}{self.items_endpoint}"
+        params = {"ids": ",".join(item_ids)}
+        
+        logger.debug(f"Looking up {len(item_ids)} items by ID in one request")
+        status, data = await self._request_json(url, params)
+        
+        wanted = set(item_ids)
+        items = {}
+        results = self._unwrap_items(data)
+        if results:
+            for item_data in results:
+                if isinstance(item_data, dict) and str(item_data.get('id')) in wanted:
+                    items[str(item_data['id'])] = item_data
+        
+        # Rejected (e.g. 400/404/5xx) or ignored the batch parameter; stop trying it.
+        # Rate limiting and network failures say nothing about batch support.
+        if status is not None and status != 429 and not items:
+            logger.info("Batched item lookups not supported by the API, using per-item lookups")
+            self._batch_lookup_supported = False
+        
+        return items
+    
+    async def _load_stored_item(self, item_id: str):
+        """Load item details from the SQLite item cache if present and fresh"""
+        if self.cache_db is None or not item_id.isdigit():
+            return None
+        
+        try:
+            async with self.cache_db.execute(
+                "SELECT payload, fetched_at FROM items WHERE id = ?", (int(item_id),)
+            ) as cursor:
+                row = await cursor.fetchone()
+            
+            if row is None:
+                return None
+            
+            payload, fetched_at = row
+            if time.time() - fetched_at > self.ITEM_DB_CACHE_TTL:
+                return None
+            
+            return json_loads(payload)
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Error reading item ID '{item_id}' from item cache: {e}")
+            return None
+    
+    def _store_item(self, item_id: str, item_data: Dict[str, Any]):
+        """Queue item details to be saved to the SQLite item cache"""
+        if self.cache_db is None or not item_id.isdigit():
+            return
+        
+        try:
+            payload = json_dumps(item_data)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Error saving item ID '{item_id}' to item cache: {e}")
+            return
+        
+        self._queue_db_write(
+            ("items", item_id),
+            "INSERT OR REPLACE INTO items (id, name, payload, fetched_at) VALUES (?, ?, ?, ?)",
+            (int(item_id), item_data.get("name"), payload, int(time.time()))
+        )
+    
+    def _queue_db_write(self, key: Tuple[str, str], sql: str, params: tuple):
+        """Queue a SQLite cache write; writes are committed together every few seconds"""
+        self._pending_db_writes[key] = (sql, params)
+        if self._db_flush_task is None or self._db_flush_task.done():
+            self._db_flush_task = asyncio.create_task(self._flush_db_writes_later())
+    
+    async def _flush_db_writes_later(self):
+        """Wait for more writes to accumulate, then flush them"""
+        await asyncio.sleep(self.DB_FLUSH_INTERVAL)
+        await self.flush_db_writes()
+    
+    async def flush_db_writes(self):
+        """Write all queued cache entries to SQLite in a single transaction"""
+        if self.cache_db is None or not self._pending_db_writes:
+            return
+        
+        writes_by_sql: Dict[str, List[tuple]] = {}
+        for sql, params in self._pending_db_writes.values():
+            writes_by_sql.setdefault(sql, []).append(params)
+        count = len(self._pending_db_writes)
+        self._pending_db_writes.clear()
+        
+        try:
+            for sql, rows in writes_by_sql.items():
+                await self.cache_db.executemany(sql, rows)
+            await self.cache_db.commit()
+            logger.debug(f"Flushed {count} cache entries to SQLite")
+        except sqlite3.Error as e:
+            logger.warning(f"Error writing {count} cache entries to SQLite: {e}")
+    
+    async def close(self):
+        """Flush pending cache writes before shutdown"""
+        if self._db_flush_task is not None and not self._db_flush_task.done():
+            self._db_flush_task.cancel()
+        await self.flush_db_writes()
+    
+    async def _fetch_item_by_id(self, item_id: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Fetch item details by ID from the API
+        
+        Returns (item_data, definitive); definitive is False when the lookup
+        failed rather than the item being missing, so it should not be cached.
+        """
         try:
             url = f"{self.base_url}{self.items_endpoint}"
             params = {"id": item_id}
             
             logger.debug(f"Looking up item by ID: {item_id}")
-            data = await self._make_json_request(url, params)
+            status, data = await self._request_json(url, params)
             
-            if data is None:
+            if status == 404:
                 logger.debug(f"No item found for ID: {item_id}")
-                return None
+                return None, True
+            if data is None:
+                logger.debug(f"Item lookup failed for ID: {item_id}")
+                return None, False
                 
-            # Handle different response formats
-            if isinstance(data, list):
-                if len(data) > 0:
-                    return data[0]  # Return first result
-                else:
-                    return None
-            elif isinstance(data, dict):
-                # Check if it's a single item result or a wrapper object
-                if 'items' in data and isinstance(data['items'], list):
-                    items = data['items']
-                    if len(items) > 0:
-                        return items[0]
-                    else:
-                        return None
-                else:
-                    return data  # Assume it's a single item result
-            else:
+            items = self._unwrap_items(data)
+            if items is None:
                 logger.warning(f"Unexpected response format for item ID lookup: {type(data)}")
-                return None
+                return None, False
+            
+            return (items[0] if items else None), True  # Return first result
                 
         except Exception as e:
             logger.error(f"Error looking up item ID '{item_id}': {e}")
-            return None
+            return None, False
     
     async def get_recipe(self, item_id: str):
-        """Get crafting recipe for an item using the trades endpoint"""
+        """Get crafting recipe for an item, using the recipe cache when possible"""
+        hit, recipe = self._recipe_cache.get(item_id)
+        if hit:
+            logger.debug(f"Recipe cache hit for item ID: {item_id}")
+            return recipe
+        
+        return await self._single_flight(self._recipe_inflight, item_id, self._load_recipe)
+    
+    async def _load_recipe(self, item_id: str):
+        """Load a recipe from SQLite or the API and cache it in memory"""
+        stored = await self._load_stored_recipe(item_id)
+        if stored is not None:
+            recipe, age = stored
+            self._recipe_cache.set(item_id, recipe, self.RECIPE_CACHE_TTL - age)
+            return recipe
+        
+        # Only cache definitive answers: complete recipes and confirmed missing ones.
+        # Transport failures and partially resolved recipes are retried next time.
+        recipe, definitive = await self._fetch_recipe(item_id)
+        if recipe is not None:
+            if definitive:
+                self._recipe_cache.set(item_id, recipe, self.RECIPE_CACHE_TTL)
+                self._store_recipe(item_id, recipe)
+        elif definitive:
+            self._recipe_cache.set(item_id, None, self.RECIPE_NEGATIVE_CACHE_TTL)
+        return recipe
+    
+    async def clear_recipe_cache(self) -> int:
+        """Drop all cached recipes (memory and SQLite) and return how many were in memory"""
+        count = len(self._recipe_cache)
+        self._recipe_cache.clear()
+        
+        for key in [key for key in self._pending_db_writes if key[0] == "recipes"]:
+            del self._pending_db_writes[key]
+        if self.cache_db is not None:
+            try:
+                await self.cache_db.execute("DELETE FROM recipes")
+                await self.cache_db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Error clearing stored recipes: {e}")
+        
+        return count
+    
+    async def _load_stored_recipe(self, item_id: str) -> Optional[Tuple[Recipe, float]]:
+        """Load a recipe and its age in seconds from the SQLite cache if present and fresh"""
+        if self.cache_db is None or not item_id.isdigit():
+            return None
+        
+        try:
+            async with self.cache_db.execute(
+                "SELECT json, fetched_at FROM recipes WHERE item_id = ?", (int(item_id),)
+            ) as cursor:
+                row = await cursor.fetchone()
+            
+            if row is None:
+                return None
+            
+            payload, fetched_at = row
+            age = time.time() - fetched_at
+            if age >= self.RECIPE_CACHE_TTL:
+                return None
+            
+            return Recipe(**json_loads(payload)), age
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Error reading recipe for item ID '{item_id}' from cache: {e}")
+            return None
+    
+    def _store_recipe(self, item_id: str, recipe: Recipe):
+        """Queue a parsed recipe to be saved to the SQLite cache"""
+        if self.cache_db is None or not item_id.isdigit():
+            return
+        
+        try:
+            payload = json_dumps(asdict(recipe))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Error saving recipe for item ID '{item_id}' to cache: {e}")
+            return
+        
+        self._queue_db_write(
+            ("recipes", item_id),
+            "INSERT OR REPLACE INTO recipes (item_id, json, fetched_at) VALUES (?, ?, ?)",
+            (int(item_id), payload, int(time.time()))
+        )
+    
+    async def _fetch_recipe(self, item_id: str) -> Tuple[Optional[Recipe], bool]:
+        """Fetch crafting recipe for an item using the trades endpoint
+        
+        Returns (recipe, definitive); definitive is False when the lookup failed
+        or the recipe could not be fully resolved, so it should not be cached.
+        """
         try:
             url = f"{self.base_url}{self.trades_endpoint}"
             params = {"id": item_id}
             
             logger.info(f"Fetching recipe for item ID: {item_id}")
-            data = await self._make_json_request(url, params)
+            status, data = await self._request_json(url, params)
             
-            if data is None:
+            if status == 404:
                 logger.info(f"No recipe data found for item ID: {item_id}")
-                return None
+                return None, True
+            if data is None:
+                logger.info(f"Recipe lookup failed for item ID: {item_id}")
+                return None, False
             
             # Check if the response indicates no recipe exists
             if isinstance(data, dict):
                 # Some APIs return empty objects or error indicators
                 if not data or data.get('error') or data.get('success') is False:
                     logger.info(f"API indicates no recipe for item ID: {item_id}")
-                    return None
+                    return None, True
                     
                 # Parse the recipe data (this will now include component name lookups)
-                recipe = await self._parse_recipe_with_names(data)
+                recipe, complete = await self._parse_recipe_with_names(data)
                 logger.info(f"Successfully parsed recipe for: {recipe.name}")
-                return recipe
+                return recipe, complete
             elif isinstance(data, list):
                 # If multiple recipes returned, take the first one
                 if len(data) > 0:
-                    recipe = await self._parse_recipe_with_names(data[0])
+                    recipe, complete = await self._parse_recipe_with_names(data[0])
                     logger.info(f"Successfully parsed recipe for: {recipe.name}")
-                    return recipe
+                    return recipe, complete
                 else:
                     logger.info(f"Empty recipe list for item ID: {item_id}")
-                    return None
+                    return None, True
             else:
                 logger.warning(f"Unexpected response format for recipe: {type(data)}")
-                return None
+                return None, False
                 
         except Exception as e:
             logger.error(f"Error fetching recipe for item ID '{item_id}': {e}")
-            return None
+            return None, False
+    
+    @staticmethod
+    def _inline_item_name(entry: Dict[str, Any]) -> Optional[str]:
+        """Get an item name already included in a tradeskill entry, if any"""
+        item = entry.get("item")
+        return (
+            entry.get("item_name")
+            or entry.get("name")
+            or (item.get("name") if isinstance(item, dict) else None)
+        )
+    
+    async def _parse_recipe_with_names(self, data) -> Tuple[Recipe, bool]:
+        """Parse API response into Recipe object with component name lookups
+        
+        Returns (recipe, complete); complete is False if parsing failed or any
+        container/component name could not be resolved.
+        """
+        try:
+            # Log the raw data structure for debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Parsing recipe data: %s...", json_dumps_pretty(data)[:300])
+            
+            # Extract basic recipe information
+            name = data.get("name", "Unknown Recipe")
+            trivial_level = data.get("trivial", None)
+            skill_needed = data.get("skillneeded", 0)
+            tradeskill_id = data.get("tradeskill", None)
+            
+            # Map tradeskill ID to name
+            if tradeskill_id is not None:
+                names_by_id = self.TRADESKILL_NAMES_BY_ID
+                if isinstance(tradeskill_id, int) and 0 <= tradeskill_id < len(names_by_id) and names_by_id[tradeskill_id]:
+                    profession = names_by_id[tradeskill_id]
+                else:
+                    profession = f"Unknown Skill ({tradeskill_id})"
+                logger.debug(f"Mapped tradeskill ID {tradeskill_id} to {profession}")
+            else:
+                profession = "Unknown"
+            
+            # Parse tradeskill_entries for components and container
+            components = []
+            crafting_station = "Unknown"
+            
+            # Split entries into containers and components first so that all
+            # name lookups can be dispatched concurrently in one batch
+            container_entries = []
+            component_entries = []
+
+            tradeskill_entries = data.get("tradeskill_entries", [])
+            if isinstance(tradeskill_entries, list):
+                for entry in tradeskill_entries:
+                    if isinstance(entry, dict):
+                        # Check if this is a crafting container
+                        if entry.get("iscontainer", 0) == 1:
+                            container_entries.append(entry)
+                        # Check if this is a component (has componentcount > 0)
+                        elif entry.get("componentcount", 0) > 0:
+                            component_entries.append(entry)
+
+            # Prefer item names embedded in the entries, then look up the
+            # remaining container and component names in one batch
+            lookup_entries = container_entries + component_entries
+            item_names = [self._inline_item_name(entry) for entry in lookup_entries]
+            missing = [index for index, item_name in enumerate(item_names) if not item_name]
+            if missing:
+                missing_ids = [str(lookup_entries[index].get("item_id")) for index in missing]
+                items = await self.get_items_by_ids(missing_ids)
+                for index, item_id in zip(missing, missing_ids):
+                    item_data = items.get(item_id)
+                    if item_data:
+                        item_names[index] = item_data.get("name")
+            complete = all(item_names)
+
+            for entry, item_name in zip(container_entries, item_names):
+                container_item_id = entry.get("item_id")
+                crafting_station = item_name or f"Container ID: {container_item_id}"
+                logger.debug(f"Found crafting container: {crafting_station}")
+
+            for entry, item_name in zip(component_entries, item_names[len(container_entries):]):
+                item_id = entry.get("item_id")
+                quantity = entry.get("componentcount", 1)
+                component_name = item_name or f"Item ID: {item_id}"
+
+                component = {
+                    "name": component_name,
+                    "quantity": quantity,
+                    "item_id": item_id
+                }
+                components.append(component)
+                logger.debug(f"Found component: {quantity}x {component_name}")
+            
+            # Ensure numeric fields are properly typed (the API normally sends ints)
+            if isinstance(skill_needed, int):
+                skill_level = skill_needed
+            elif skill_needed is None:
+                skill_level = 0
+            else:
+                try:
+                    skill_level = int(skill_needed)
+                except (ValueError, TypeError):
+                    logger.warning(f"Invalid skill_needed value: {skill_needed}, defaulting to 0")
+                    skill_level = 0
+                
+            if trivial_level is not None and not isinstance(trivial_level, int):
+                try:
+                    trivial_level = int(trivial_level)
+                except (ValueError, TypeError):
+                    logger.warning(f"Invalid trivial_level value: {trivial_level}, setting to None")
+                    trivial_level = None
+            
+            recipe = Recipe(
+                name=str(name),
+                skill_level=skill_level,
+                profession=str(profession),
+                crafting_station=str(crafting_station),
+                components=components,
+                success_rate=None,  # Not available in this API response format
+                trivial_level=trivial_level
+            )
+            
+            logger.debug(f"Successfully parsed recipe: {recipe.name} ({recipe.profession})")
+            return recipe, complete
+            
+        except Exception as e:
+            logger.error(f"Error parsing recipe data: {e}")
+            # Return a basic recipe with error information
+            return Recipe(
+                name="Error parsing recipe",
+                skill_level=0,
+                profession="Unknown",
+                crafting_station="Unknown",
+                components=[]
+            ), False
     
     def _parse_recipe(self, data: Dict[str, Any]) -> Recipe:
         """Parse API response into Recipe object with robust JSON handling"""
         try:
             # Log the raw data structure for debugging
-            logger.debug(f"Parsing recipe data: {json.dumps(data, indent=2)[:300]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Parsing recipe data: %s...", json_dumps_pretty(data)[:300])
             
-            # Extract fields with multiple possible field names and defaults
-            name = self._get_field_value(data, ['name', 'item_name', 'recipe_name'], 'Unknown Recipe')
-            skill_level = self._get_field_value(data, ['skill', 'skill_level', 'required_skill', 'skilllevel'], 0)
-            profession = self._get_field_value(data, ['tradeskill', 'profession', 'trade_skill'], 'Unknown')
-            crafting_station = self._get_field_value(data, ['station', 'container', 'crafting_station'], 'Unknown')
-            components = self._get_field_value(data, ['components', 'ingredients', 'items'], [])
-            success_rate = self._get_field_value(data, ['success_rate', 'successrate'], None)
-            trivial_level = self._get_field_value(data, ['trivial', 'trivial_level', 'triviallevel'], None)
+            # Extract fields with multiple possible field names in a single pass,
+            # keeping the highest-priority alias present for each field
+            fields = {}
+            priorities = {}
+            for key, value in data.items():
+                alias = self._FIELD_ALIASES.get(key)
+                if alias is not None and value is not None:
+                    field, priority = alias
+                    if field not in fields or priority < priorities[field]:
+                        fields[field] = value
+                        priorities[field] = priority
+            
+            name = fields.get('name', 'Unknown Recipe')
+            skill_level = fields.get('skill_level', 0)
+            profession = fields.get('profession', 'Unknown')
+            crafting_station = fields.get('crafting_station', 'Unknown')
+            components = fields.get('components', [])
+            success_rate = fields.get('success_rate')
+            trivial_level = fields.get('trivial_level')
             
             # Ensure numeric fields are actually numeric
             try:
@@ -406,35 +963,45 @@ class EQDBClient:
                 crafting_station="Unknown",
                 components=[]
             )
-    
-    def _get_field_value(self, data, field_names, default=None):
-        """Get a field value from JSON data, trying multiple possible field names"""
-        for field_name in field_names:
-            if field_name in data and data[field_name] is not None:
-                return data[field_name]
-        return default
 
 class CraftingBot(commands.Bot):
     """Main bot class for EverQuest crafting requests"""
     
+    # Command prefix, kept as a plain string so on_message can cheaply skip non-commands
+    COMMAND_PREFIX = '!'
+    
     def __init__(self):
         intents = discord.Intents.default()
         intents.message_content = True
         
         super().__init__(
-            command_prefix='!',
+            command_prefix=self.COMMAND_PREFIX,
             intents=intents,
             description="EverQuest Crafting Request Bot"
         )
         
         self.session = None
+        self.cache_db = None
         self.eqdb_client = None
         self.watched_forum_id = None
+        self._watched_forum = None                # Resolved watched forum channel, cached
         
     async def setup_hook(self):
         """Initialize bot components"""
-        self.session = aiohttp.ClientSession()
-        self.eqdb_client = EQDBClient(self.session)
+        # Persistent connection pool so item lookups reuse keep-alive connections
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            keepalive_timeout=60,
+            ttl_dns_cache=300
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=15, connect=5),
+            headers=EQDBClient.DEFAULT_HEADERS
+        )
+        self.cache_db = await self._open_cache_db(os.getenv('ITEM_CACHE_DB', 'item_cache.sqlite'))
+        self.eqdb_client = EQDBClient(self.session, self.cache_db)
         
         # Get watched forum ID from environment
         forum_id_str = os.getenv('WATCHED_FORUM_ID')
@@ -449,16 +1016,63 @@ class CraftingBot(commands.Bot):
             
         logger.info("Bot setup completed")
     
+    async def _open_cache_db(self, path: str):
+        """Open the SQLite item/recipe cache, or return None if it is unavailable"""
+        if aiosqlite is None:
+            logger.warning("aiosqlite not installed. Items and recipes will only be cached in memory.")
+            return None
+        
+        try:
+            db = await aiosqlite.connect(path)
+            await db.execute("PRAGMA journal_mode=WAL")
+            await db.execute("PRAGMA synchronous=NORMAL")
+            await db.execute(
+                "CREATE TABLE IF NOT EXISTS items ("
+                "id INTEGER PRIMARY KEY, name TEXT, payload BLOB, fetched_at INTEGER)"
+            )
+            await db.execute(
+                "CREATE TABLE IF NOT EXISTS recipes ("
+                "item_id INTEGER PRIMARY KEY, json BLOB, fetched_at INTEGER)"
+            )
+            await db.commit()
+            logger.info(f"Using cache database: {path}")
+            return db
+        except sqlite3.Error as e:
+            logger.error(f"Could not open cache database '{path}': {e}")
+            return None
+    
     async def close(self):
         """Cleanup when bot shuts down"""
         if self.session:
             await self.session.close()
+        if self.eqdb_client:
+            await self.eqdb_client.close()
+        if self.cache_db:
+            await self.cache_db.close()
         await super().close()
         logger.info("Bot shutdown completed")
     
     async def on_ready(self):
         """Called when bot is ready"""
         logger.info(f'{self.user} has connected to Discord!')
+        self._watched_forum = None
+        self.get_watched_forum()
+    
+    def get_watched_forum(self):
+        """Get the watched forum channel, resolving it once and caching the result"""
+        if self._watched_forum is None and self.watched_forum_id:
+            self._watched_forum = self.get_channel(self.watched_forum_id)
+        return self._watched_forum
+    
+    async def on_guild_channel_update(self, before, after):
+        """Keep the cached watched forum in sync with channel edits"""
+        if after.id == self.watched_forum_id:
+            self._watched_forum = after
+    
+    async def on_guild_channel_delete(self, channel):
+        """Drop the cached watched forum if it is deleted"""
+        if channel.id == self.watched_forum_id:
+            self._watched_forum = None
         
     async def process_forum_post(self, thread: discord.Thread):
         """Process a new forum post for crafting requests"""
@@ -530,37 +1144,18 @@ class CraftingBot(commands.Bot):
                     "An error occurred while processing your request. Please try again or use manual commands."
                 )
                 await thread.send(embed=embed)
-            except:
+            except discord.HTTPException:
                 pass  # Ignore errors when trying to send error message
     
     def parse_forum_post_title(self, title: str):
         """Parse forum post title for crafting requests"""
-        # Pattern 1: "Item Name for Character"
-        pattern1 = r'(.+?)\s+for\s+(\w+)'
-        match1 = re.match(pattern1, title.strip(), re.IGNORECASE)
-        
-        if match1:
-            item = match1.group(1).strip()
-            character = match1.group(2).strip()
-            return item, character
-        
-        # Pattern 2: "Character needs Item Name" 
-        pattern2 = r'(\w+)\s+needs\s+(.+)'
-        match2 = re.match(pattern2, title.strip(), re.IGNORECASE)
-        
-        if match2:
-            character = match2.group(1).strip()
-            item = match2.group(2).strip()
-            return item, character
-            
-        # Pattern 3: "Request: Item Name - Character"
-        pattern3 = r'request:?\s*(.+?)\s*[-–]\s*(\w+)'
-        match3 = re.match(pattern3, title.strip(), re.IGNORECASE)
-        
-        if match3:
-            item = match3.group(1).strip()
-            character = match3.group(2).strip()
-            return item, character
+        title = title.strip()
+        for pattern, (item_group, character_group) in FORUM_TITLE_PATTERNS:
+            match = pattern.match(title)
+            if match:
+                item = match.group(item_group).strip()
+                character = match.group(character_group).strip()
+                return item, character
         
         return None
         
@@ -583,21 +1178,34 @@ def parse_request_command(message: str):
     # This function is no longer used as the bot is forum-only
     return None
 
+# Recipe details field text, filled in from a Recipe
+RECIPE_DETAILS_TEMPLATE = (
+    "**Profession:** {recipe.profession}\n"
+    "**Skill Level:** {recipe.skill_level}\n"
+    "**Crafting Station:** {recipe.crafting_station}"
+)
+
+# Recipe embed description, filled in with the requesting character
+RECIPE_DESCRIPTION_TEMPLATE = "Requested for character: **{character}**"
+
 def create_recipe_embed(recipe: Recipe, character: str) -> discord.Embed:
     """Create Discord embed for recipe information"""
+    embed = _build_recipe_embed(recipe)
+    embed.description = RECIPE_DESCRIPTION_TEMPLATE.format_map({"character": character})
+    embed.timestamp = datetime.utcnow()
+    return embed
+
+def _build_recipe_embed(recipe: Recipe) -> discord.Embed:
+    """Build the character-independent part of a recipe embed"""
     embed = discord.Embed(
         title=f"🔨 Recipe: {recipe.name}",
-        description=f"Requested for character: **{character}**",
-        color=discord.Color.blue(),
-        timestamp=datetime.utcnow()
+        color=discord.Color.blue()
     )
     
     # Add recipe details
     embed.add_field(
         name="📊 Details",
-        value=f"**Profession:** {recipe.profession}\n"
-              f"**Skill Level:** {recipe.skill_level}\n"
-              f"**Crafting Station:** {recipe.crafting_station}",
+        value=RECIPE_DETAILS_TEMPLATE.format(recipe=recipe),
         inline=True
     )
     
@@ -617,19 +1225,18 @@ def create_recipe_embed(recipe: Recipe, character: str) -> discord.Embed:
     
     # Add components with better JSON data handling
     if recipe.components:
-        components_text = ""
+        component_lines = []
+        append = component_lines.append
         for component in recipe.components:
             if isinstance(component, dict):
                 # Handle component as JSON object
                 name = component.get('name', component.get('item_name', 'Unknown'))
                 quantity = component.get('quantity', component.get('count', 1))
-                components_text += f"• {quantity}x {name}\n"
-            elif isinstance(component, str):
-                # Handle component as simple string
-                components_text += f"• {component}\n"
+                append(f"• {quantity}x {name}")
             else:
-                # Handle unexpected format
-                components_text += f"• {str(component)}\n"
+                # Handle component as simple string or unexpected format
+                append(f"• {component}")
+        components_text = "\n".join(component_lines)
         
         # Limit component list length for Discord embed limits
         if len(components_text) > 1000:
@@ -666,6 +1273,60 @@ def create_info_embed(title: str, description: str) -> discord.Embed:
         color=discord.Color.blue()
     )
 
+def create_help_embed() -> discord.Embed:
+    """Create help embed for the forum-based crafting bot"""
+    embed = discord.Embed(
+        title="🔨 EverQuest Forum Crafting Bot",
+        description="Automated crafting recipe responses for Discord forums",
+        color=discord.Color.green()
+    )
+    
+    embed.add_field(
+        name="🏛️ How It Works",
+        value="Simply create a new post in the watched forum with your item and character in the title.\n"
+              "The bot will automatically respond with the full crafting recipe!",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="📝 Commands",
+        value="`!forum_info` - Show current forum configuration and help\n"
+              "`!help_crafting` - Show this help message",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="🏷️ Forum Post Title Examples",
+        value="`Black Acrylia Pick for Gandalf`\n"
+              "`Mychar needs Ancient Spell: Word of Morell`\n"
+              "`Request: Hardened Clay Brick - Builder`",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="ℹ️ Setup",
+        value="• Administrator runs `!forum_info` in the crafting forum\n"
+              "• Copy the Forum ID and add to bot configuration\n"
+              "• Users create posts with item requests\n"
+              "• Bot automatically replies with recipes!",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="🎯 What You Get",
+        value="• Complete ingredient lists with quantities\n"
+              "• Skill level and trivial level requirements\n"
+              "• Tradeskill profession (Blacksmithing, Pottery, etc.)\n"
+              "• Crafting station needed\n"
+              "• All data sourced from eqdb.net",
+        inline=False
+    )
+    
+    return embed
+
+# The help embed never changes, so it is built once and reused by !help_crafting
+HELP_EMBED = create_help_embed()
+
 # Bot instance
 bot = CraftingBot()
 
@@ -750,10 +1411,10 @@ async def request_item(ctx: commands.Context, *, args: str = None):
         recipe_embed = create_recipe_embed(recipe, character)
         await message.edit(embed=recipe_embed)
         
-        logger.info(f"Recipe request fulfilled: {item} for {character} by {ctx.author}")
+        logger.info("Recipe request fulfilled: %s for %s by %s", item, character, ctx.author)
         
     except Exception as e:
-        logger.error(f"Error processing request: {e}")
+        logger.error("Error processing request: %s", e)
         embed = create_error_embed(
             "Processing Error",
             "An error occurred while processing your request. Please try again later."
@@ -775,8 +1436,12 @@ async def request_item_by_id(ctx: commands.Context, character: str = None, item_
         await ctx.send(embed=embed)
         return
     
-    # Validate that item_id is numeric
-    if not item_id.isdigit():
+    # Validate that item_id is a non-negative number
+    try:
+        item_id_number = int(item_id)
+        if item_id_number < 0:
+            raise ValueError(item_id)
+    except ValueError:
         embed = create_error_embed(
             "Invalid Item ID",
             "Item ID must be a number.\n"
@@ -785,6 +1450,9 @@ async def request_item_by_id(ctx: commands.Context, character: str = None, item_
         await ctx.send(embed=embed)
         return
     
+    # Use the canonical form (e.g. "0042" -> "42") so cache lookups match
+    item_id = str(item_id_number)
+    
     # Send initial processing message
     processing_embed = create_info_embed(
         "Processing Request",
@@ -809,10 +1477,10 @@ async def request_item_by_id(ctx: commands.Context, character: str = None, item_
         recipe_embed = create_recipe_embed(recipe, character)
         await message.edit(embed=recipe_embed)
         
-        logger.info(f"Recipe request by ID fulfilled: {item_id} for {character} by {ctx.author}")
+        logger.info("Recipe request by ID fulfilled: %s for %s by %s", item_id, character, ctx.author)
         
     except Exception as e:
-        logger.error(f"Error processing request by ID: {e}")
+        logger.error("Error processing request by ID: %s", e)
         embed = create_error_embed(
             "Processing Error",
             "An error occurred while processing your request. Please try again later."
@@ -836,7 +1504,7 @@ async def forum_info(ctx: commands.Context):
     
     # Bot configuration
     if bot.watched_forum_id:
-        watched_forum = bot.get_channel(bot.watched_forum_id)
+        watched_forum = bot.get_watched_forum()
         if watched_forum and isinstance(watched_forum, discord.ForumChannel):
             status = f"**Watching Forum:** #{watched_forum.name} (ID: {bot.watched_forum_id}) ✅"
         elif watched_forum:
@@ -877,66 +1545,40 @@ async def forum_info(ctx: commands.Context):
 @bot.command(name='help_crafting')
 async def help_crafting(ctx: commands.Context):
     """Show help information for the forum-based crafting bot"""
-    embed = discord.Embed(
-        title="🔨 EverQuest Forum Crafting Bot",
-        description="Automated crafting recipe responses for Discord forums",
-        color=discord.Color.green()
-    )
-    
-    embed.add_field(
-        name="🏛️ How It Works",
-        value="Simply create a new post in the watched forum with your item and character in the title.\n"
-              "The bot will automatically respond with the full crafting recipe!",
-        inline=False
-    )
-    
-    embed.add_field(
-        name="📝 Commands",
-        value="`!forum_info` - Show current forum configuration and help\n"
-              "`!help_crafting` - Show this help message",
-        inline=False
-    )
-    
-    embed.add_field(
-        name="🏷️ Forum Post Title Examples",
-        value="`Black Acrylia Pick for Gandalf`\n"
-              "`Mychar needs Ancient Spell: Word of Morell`\n"
-              "`Request: Hardened Clay Brick - Builder`",
-        inline=False
-    )
-    
-    embed.add_field(
-        name="ℹ️ Setup",
-        value="• Administrator runs `!forum_info` in the crafting forum\n"
-              "• Copy the Forum ID and add to bot configuration\n"
-              "• Users create posts with item requests\n"
-              "• Bot automatically replies with recipes!",
-        inline=False
-    )
+    await ctx.send(embed=HELP_EMBED)
+
+@bot.command(name='recipe_cache_clear')
+@commands.has_permissions(administrator=True)
+async def recipe_cache_clear(ctx: commands.Context):
+    """Clear cached recipes so they are fetched fresh from eqdb.net"""
+    count = await bot.eqdb_client.clear_recipe_cache()
+    logger.info("Recipe cache cleared by %s (%s entries)", ctx.author, count)
     
-    embed.add_field(
-        name="🎯 What You Get",
-        value="• Complete ingredient lists with quantities\n"
-              "• Skill level and trivial level requirements\n"
-              "• Tradeskill profession (Blacksmithing, Pottery, etc.)\n"
-              "• Crafting station needed\n"
-              "• All data sourced from eqdb.net",
-        inline=False
+    embed = create_info_embed(
+        "Recipe Cache Cleared",
+        f"Removed **{count}** cached recipes. They will be fetched fresh from eqdb.net."
     )
-    
     await ctx.send(embed=embed)
 
 @bot.event
 async def on_message(message):
     """Handle incoming messages for manual commands"""
-    if message.author == bot.user:
+    # Ignore bots (including ourselves) and skip the command parser for plain messages
+    if message.author.bot or not message.content.startswith(CraftingBot.COMMAND_PREFIX):
         return
     
     # Always process manual commands regardless of forum configuration
     await bot.process_commands(message)
 
+# Set once the environment has validated; it cannot change mid-process
+_ENV_VALIDATED = False
+
 def validate_environment():
     """Validate required environment variables"""
+    global _ENV_VALIDATED
+    if _ENV_VALIDATED:
+        return True
+    
     required_vars = {
         'DISCORD_BOT_TOKEN': 'Discord bot token is required',
         'WATCHED_FORUM_ID': 'Forum ID to watch is required'
@@ -954,16 +1596,58 @@ def validate_environment():
         logger.error("Please check your .env file or environment configuration")
         return False
     
+    _ENV_VALIDATED = True
     return True
 
 def setup_signal_handlers(bot):
-    """Setup graceful shutdown on SIGTERM/SIGINT"""
-    def signal_handler(signum, frame):
+    """Setup graceful shutdown on SIGTERM/SIGINT (call from within the running event loop)"""
+    loop = asyncio.get_running_loop()
+    shutdown_tasks = set()  # Keep references so shutdown tasks are not garbage collected
+    
+    def signal_handler(signum):
         logger.info(f"Received signal {signum}. Initiating graceful shutdown...")
-        asyncio.create_task(bot.close())
+        task = loop.create_task(bot.close())
+        shutdown_tasks.add(task)
+        task.add_done_callback(shutdown_tasks.discard)
     
-    signal.signal(signal.SIGTERM, signal_handler)
-    signal.signal(signal.SIGINT, signal_handler)
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(signum, signal_handler, signum)
+        except NotImplementedError:
+            # Not supported by Windows event loops; Ctrl+C still stops the bot
+            pass
+
+async def run_bot(bot, token: str):
+    """Run the bot until it is closed, handling shutdown signals on the event loop"""
+    setup_signal_handlers(bot)
+    try:
+        await bot.start(token)
+    finally:
+        if not bot.is_closed():
+            await bot.close()
+
+def run_event_loop(main_coro):
+    """Run a coroutine on uvloop's faster event loop when it is installed (not available on Windows)"""
+    if sys.platform == 'win32':
+        return asyncio.run(main_coro)
+    
+    try:
+        import uvloop
+    except ImportError:
+        logger.info("uvloop not installed. Using the default asyncio event loop.")
+        return asyncio.run(main_coro)
+    
+    # Pick the loop for this run only instead of changing the global event loop policy
+    if sys.version_info >= (3, 11):
+        logger.info("Using uvloop event loop")
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(main_coro)
+    if hasattr(uvloop, 'run'):  # uvloop 0.18+
+        logger.info("Using uvloop event loop")
+        return uvloop.run(main_coro)
+    
+    logger.info("uvloop.run() needs uvloop 0.18+ on this Python. Using the default asyncio event loop.")
+    return asyncio.run(main_coro)
 
 def main():
     """Main entry point"""
@@ -979,13 +1663,11 @@ def main():
     # Create bot instance
     bot = CraftingBot()
     
-    # Setup signal handlers for graceful shutdown
-    setup_signal_handlers(bot)
-    
     try:
-        # Run the bot
+        # Run the bot; signal handlers for graceful shutdown are set up inside
+        # the event loop. bot.start() leaves logging to us.
         logger.info("Connecting to Discord...")
-        bot.run(token, log_handler=None)  # We handle logging ourselves
+        run_event_loop(run_bot(bot, token))
     except discord.LoginFailure:
         logger.error("Invalid Discord bot token! Please check your DISCORD_BOT_TOKEN environment variable.")
         sys.exit(1)
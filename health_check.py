@@ -6,11 +6,28 @@ Can be used for monitoring, Docker health checks, or automated restarts
 
 import os
 import sys
+import functools
+import importlib.util
 import time
 import json
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 
+# Use orjson for faster JSON output when available
+try:
+    import orjson
+
+    def to_json(data, indent=False) -> str:
+        """Serialize data to a JSON string"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None).decode()
+except ImportError:
+    def to_json(data, indent=False) -> str:
+        """Serialize data to a JSON string"""
+        return json.dumps(data, indent=2 if indent else None)
+
+# Bytes read from the end of the log file when looking for recent errors
+LOG_TAIL_BYTES = 16384
+
 def check_pid_file():
     """Check if bot is running via PID file"""
     pid_file = Path("eq_bot.pid")
@@ -38,23 +55,32 @@ def check_log_file():
     
     try:
         # Check if log has been updated in the last 5 minutes
-        mtime = datetime.fromtimestamp(log_file.stat().st_mtime)
-        if datetime.now() - mtime > timedelta(minutes=5):
-            return False, f"Log file last updated {mtime}"
+        stat = log_file.stat()
+        if time.time() - stat.st_mtime > 300:
+            return False, f"Log file last updated {datetime.fromtimestamp(stat.st_mtime)}"
+        
+        # Check for recent ERROR entries, reading only the tail of the file
+        with open(log_file, 'rb') as f:
+            f.seek(max(0, stat.st_size - LOG_TAIL_BYTES))
+            buf = f.read()
         
-        # Check for recent ERROR entries
-        with open(log_file, 'r') as f:
-            lines = f.readlines()
-            recent_lines = lines[-50:]  # Check last 50 lines
-            
-            error_count = sum(1 for line in recent_lines if " ERROR " in line)
-            if error_count > 10:  # Too many errors
-                return False, f"High error count in recent logs: {error_count}"
+        # Find where the last 50 lines start, then count errors in one scan
+        # (a single trailing newline ends the last line; blank lines still count)
+        start = len(buf) - 1 if buf.endswith(b"\n") else len(buf)
+        for _ in range(50):
+            start = buf.rfind(b"\n", 0, start)
+            if start == -1:
+                break
+        
+        error_count = buf.count(b" ERROR ", start + 1)
+        if error_count > 10:  # Too many errors
+            return False, f"High error count in recent logs: {error_count}"
         
         return True, "Log file looks healthy"
     except Exception as e:
         return False, f"Error checking log file: {e}"
 
+@functools.lru_cache(maxsize=1)
 def check_environment():
     """Check if required environment variables are set"""
     required_vars = ['DISCORD_BOT_TOKEN', 'WATCHED_FORUM_ID']
@@ -81,9 +107,8 @@ def check_dependencies():
     missing = []
     
     for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
+        # find_spec checks importability without executing the package
+        if importlib.util.find_spec(package) is None:
             missing.append(package)
     
     if missing:
@@ -91,8 +116,11 @@ def check_dependencies():
     
     return True, "Dependencies OK"
 
-def run_health_check():
-    """Run all health checks and return overall status"""
+def run_health_check(fail_fast=False):
+    """Run all health checks and return overall status
+    
+    With fail_fast, stop at the first failing check and mark the rest as skipped.
+    """
     checks = [
         ("Environment", check_environment),
         ("Dependencies", check_dependencies),
@@ -104,6 +132,10 @@ def run_health_check():
     overall_healthy = True
     
     for name, check_func in checks:
+        if fail_fast and not overall_healthy:
+            results[name] = {"healthy": None, "message": "skipped"}
+            continue
+        
         try:
             healthy, message = check_func()
             results[name] = {"healthy": healthy, "message": message}
@@ -139,7 +171,7 @@ def main():
         healthy, message = check_func()
         
         if args.json:
-            print(json.dumps({"healthy": healthy, "message": message}))
+            print(to_json({"healthy": healthy, "message": message}))
         else:
             status = "✓" if healthy else "✗"
             print(f"{status} {name}: {message}")
@@ -147,7 +179,8 @@ def main():
         sys.exit(0 if healthy else 1)
     
     # Run all checks
-    overall_healthy, results = run_health_check()
+    # Quiet mode only reports the overall status, so stop at the first failure
+    overall_healthy, results = run_health_check(fail_fast=args.quiet and not args.json)
     
     if args.json:
         output = {
@@ -155,7 +188,7 @@ def main():
             "healthy": overall_healthy,
             "checks": results
         }
-        print(json.dumps(output, indent=2))
+        print(to_json(output, indent=True))
     elif args.quiet:
         print("HEALTHY" if overall_healthy else "UNHEALTHY")
     else:
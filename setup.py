@@ -15,11 +15,48 @@ def check_python_version():
         sys.exit(1)
     print(f"✓ Python version: {sys.version}")
 
+def requirements_satisfied(requirements_file="requirements.txt"):
+    """Check whether every requirement is already installed at a matching version"""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+        from packaging.requirements import InvalidRequirement, Requirement
+    except ImportError:
+        return False  # Can't tell without packaging; let pip decide
+    
+    with open(requirements_file) as f:
+        lines = [line.strip() for line in f]
+    
+    for line in lines:
+        if not line or line.startswith("#"):
+            continue
+        try:
+            requirement = Requirement(line)
+        except InvalidRequirement:
+            return False  # pip options (-r, --index-url) or inline comments; let pip decide
+        if requirement.marker and not requirement.marker.evaluate():
+            continue
+        try:
+            installed = version(requirement.name)
+        except PackageNotFoundError:
+            return False
+        if not requirement.specifier.contains(installed, prereleases=True):
+            return False
+    
+    return True
+
 def install_requirements():
     """Install required packages"""
+    if requirements_satisfied():
+        print("✓ Requirements already installed")
+        return
+    
     print("Installing requirements...")
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        subprocess.check_call([
+            sys.executable, "-m", "pip", "install",
+            "--prefer-binary", "--disable-pip-version-check",
+            "-r", "requirements.txt"
+        ])
         print("✓ Requirements installed successfully")
     except subprocess.CalledProcessError:
         print("Error: Failed to install requirements")